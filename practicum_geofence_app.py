@@ -1,5 +1,4 @@
 import io
-import math
 from datetime import datetime
 
 import numpy as np
@@ -9,31 +8,32 @@ import streamlit as st
 
 # ---------- HELPER FUNCTIONS ----------
 
+EARTH_RADIUS_M = 6371000.0
+
+
 def haversine_distance_m(lat1, lon1, lat2, lon2):
     """
     Great-circle distance in meters between two lat/long points.
-    All args should be convertible to float. Returns np.nan if anything is missing.
+    Works element-wise on scalars or NumPy arrays; NaN inputs give NaN distances.
+    Computed in float32, which is still accurate to about a meter at these scales.
     """
-    if any(pd.isna(v) for v in [lat1, lon1, lat2, lon2]):
-        return np.nan
-
-    lat1 = float(lat1)
-    lon1 = float(lon1)
-    lat2 = float(lat2)
-    lon2 = float(lon2)
+    lat1 = np.asarray(lat1).astype(np.float32, copy=False)
+    lon1 = np.asarray(lon1).astype(np.float32, copy=False)
+    lat2 = np.asarray(lat2).astype(np.float32, copy=False)
+    lon2 = np.asarray(lon2).astype(np.float32, copy=False)
 
     # degrees -> radians
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = np.radians(lat2 - lat1)
+    dlambda = np.radians(lon2 - lon1)
 
     # Haversine
-    a = (math.sin(dphi / 2) ** 2 +
-         math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    a = (np.sin(dphi / 2) ** 2 +
+         np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
-    R = 6371000  # Earth radius (m)
+    R = np.float32(EARTH_RADIUS_M)  # Earth radius (m)
     return R * c
 
 
@@ -49,27 +49,8 @@ def load_site_coordinates(site_file) -> dict:
         'Site_Name', 'Site Name', 'SITE NAME'
         'Lat', 'Latitude (deg)', etc.
     """
-    # 1) Read file: try Excel vs CSV
-    if site_file.name.lower().endswith((".xlsx", ".xls")):
-        tried = []
-        for header_row in [0, 1]:
-            try:
-                df_try = pd.read_excel(site_file, sheet_name=0, header=header_row)
-                tried.append(df_try)
-            except Exception:
-                continue
-        if not tried:
-            raise ValueError("Could not read Site_Coordinates Excel file.")
-        sites_df = tried[0]  # first successful read
-    else:
-        sites_df = pd.read_csv(site_file)
-
-    # 2) Normalize column names (strip whitespace)
-    sites_df.columns = [str(c).strip() for c in sites_df.columns]
-    cols = list(sites_df.columns)
-
     # Helper to find a column by keyword(s) in its name
-    def find_col(keywords):
+    def find_col(cols, keywords):
         # keywords: list of substrings that must all be present in lowercased col name
         for c in cols:
             low = c.lower()
@@ -77,10 +58,44 @@ def load_site_coordinates(site_file) -> dict:
                 return c
         return None
 
+    # Helper to identify the three needed columns (None where not found)
+    def identify_cols(cols):
+        site_col = find_col(cols, ["site", "name"]) or find_col(cols, ["site"])
+        lat_col = find_col(cols, ["lat"])          # matches Latitude, Lat, etc.
+        lon_col = find_col(cols, ["lon"])          # matches Longitude, Long, etc.
+        return site_col, lat_col, lon_col
+
+    # 1) Read file: try Excel vs CSV
+    is_excel = site_file.name.lower().endswith((".xlsx", ".xls"))
+    if is_excel:
+        try:
+            sites_df = pd.read_excel(site_file, sheet_name=0, header=0)
+        except Exception:
+            raise ValueError("Could not read Site_Coordinates Excel file.")
+    else:
+        sites_df = pd.read_csv(site_file)
+
+    # 2) Normalize column names (strip whitespace)
+    sites_df.columns = [str(c).strip() for c in sites_df.columns]
+
     # 3) Try to identify the three needed columns
-    site_col = find_col(["site", "name"]) or find_col(["site"])
-    lat_col = find_col(["lat"])          # matches Latitude, Lat, etc.
-    lon_col = find_col(["lon"])          # matches Longitude, Long, etc.
+    site_col, lat_col, lon_col = identify_cols(list(sites_df.columns))
+
+    # Header may be in the second row; only then read the Excel file a second time
+    if is_excel and None in (site_col, lat_col, lon_col):
+        try:
+            site_file.seek(0)
+            retry_df = pd.read_excel(site_file, sheet_name=0, header=1)
+        except Exception:
+            retry_df = None
+        if retry_df is not None:
+            retry_df.columns = [str(c).strip() for c in retry_df.columns]
+            retry_cols = identify_cols(list(retry_df.columns))
+            if None not in retry_cols:
+                sites_df = retry_df
+                site_col, lat_col, lon_col = retry_cols
+
+    cols = list(sites_df.columns)
 
     missing = []
     if site_col is None:
@@ -98,18 +113,15 @@ def load_site_coordinates(site_file) -> dict:
             + ", ".join(cols)
         )
 
-    # 4) Drop rows without a site name
-    sites_df = sites_df.dropna(subset=[site_col]).copy()
+    # 4) Build dict from rows with a site name and numeric coordinates
+    names = sites_df[site_col].astype(str).str.strip()
+    lat = pd.to_numeric(sites_df[lat_col], errors="coerce")
+    lon = pd.to_numeric(sites_df[lon_col], errors="coerce")
+    mask = sites_df[site_col].notna() & lat.notna() & lon.notna()
 
-    # 5) Build dict
-    site_coords = {}
-    for _, row in sites_df.iterrows():
-        name = str(row[site_col]).strip()
-        lat = pd.to_numeric(row[lat_col], errors="coerce")
-        lon = pd.to_numeric(row[lon_col], errors="coerce")
-        if pd.isna(lat) or pd.isna(lon):
-            continue
-        site_coords[name] = (float(lat), float(lon))
+    site_coords = dict(
+        zip(names[mask], zip(lat[mask].to_numpy(float).tolist(), lon[mask].to_numpy(float).tolist()))
+    )
 
     if not site_coords:
         raise ValueError(
@@ -120,16 +132,37 @@ def load_site_coordinates(site_file) -> dict:
     return site_coords
 
 
+def parse_recorded_date(values: pd.Series) -> pd.Series:
+    """
+    Parse Qualtrics RecordedDate values to datetimes (NaT where unparseable).
+
+    Native exports use "YYYY-MM-DD HH:MM:SS", parsed on the fast explicit-format path.
+    Anything else (e.g. "2024-01-01T10:00:00", "2024-01-01 10:00", or "1/15/2024 10:23"
+    after an Excel re-save) is re-parsed per value instead of silently becoming NaT.
+    """
+    parsed = pd.to_datetime(values, format="%Y-%m-%d %H:%M:%S", errors="coerce", cache=True)
+
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry], format="mixed", errors="coerce")
+
+    return parsed
+
+
 def clean_qualtrics_df(raw_df: pd.DataFrame) -> pd.DataFrame:
     """
     Take the raw Qualtrics export and return a cleaned dataframe with:
       Student_ID, Site_Name, Recorded_Date, Student_Latitude, Student_Longitude, Logged_Hours
     """
-    df = raw_df.copy()
+    df = raw_df
 
-    # Drop the "question text" row: LocationLatitude == "Location Latitude"
-    if "LocationLatitude" in df.columns:
-        df = df[df["LocationLatitude"] != "Location Latitude"].copy()
+    # Drop the "question text" row Qualtrics emits as the first data row
+    if (
+        "LocationLatitude" in df.columns
+        and not df.empty
+        and df["LocationLatitude"].iat[0] == "Location Latitude"
+    ):
+        df = df.iloc[1:]
 
     required_cols = ["RecordedDate", "LocationLatitude", "LocationLongitude", "Q2.1", "Q4", "Q5"]
     missing = [c for c in required_cols if c not in df.columns]
@@ -140,16 +173,16 @@ def clean_qualtrics_df(raw_df: pd.DataFrame) -> pd.DataFrame:
     if "Q2" in df.columns:
         df = df[df["Q2"] == 1]
 
-    clean = pd.DataFrame()
-    clean["Student_ID"] = df["Q2.1"].astype(str).str.strip()
-    clean["Site_Name"] = df["Q4"].astype(str).str.strip()
-
-    clean["Recorded_Date"] = pd.to_datetime(df["RecordedDate"], errors="coerce")
-    clean["Student_Latitude"] = pd.to_numeric(df["LocationLatitude"], errors="coerce")
-    clean["Student_Longitude"] = pd.to_numeric(df["LocationLongitude"], errors="coerce")
-    clean["Logged_Hours"] = pd.to_numeric(df["Q5"], errors="coerce")
-
-    return clean
+    # Built column-by-column from the filtered raw frame; raw_df itself is never copied.
+    # Categorical keys: groupby/nunique hash small integer codes instead of strings
+    return pd.DataFrame({
+        "Student_ID": df["Q2.1"].astype("string[pyarrow]").str.strip().astype("category"),
+        "Site_Name": df["Q4"].astype("string[pyarrow]").str.strip().astype("category"),
+        "Recorded_Date": parse_recorded_date(df["RecordedDate"]),
+        "Student_Latitude": pd.to_numeric(df["LocationLatitude"], errors="coerce"),
+        "Student_Longitude": pd.to_numeric(df["LocationLongitude"], errors="coerce"),
+        "Logged_Hours": pd.to_numeric(df["Q5"], errors="coerce"),
+    })
 
 
 def add_geofence_and_verification(clean_log: pd.DataFrame, site_coords: dict) -> pd.DataFrame:
@@ -157,60 +190,110 @@ def add_geofence_and_verification(clean_log: pd.DataFrame, site_coords: dict) ->
     Add Distance_From_Site_m, Verification_Status, Verified_Hours to the cleaned log,
     using a site_coords dict: {Site_Name: (lat, lon), ...}
     """
-    log = clean_log.copy()
-
-    def compute_distance(row):
-        site = row["Site_Name"]
-        lat_s = row["Student_Latitude"]
-        lon_s = row["Student_Longitude"]
-
-        if site not in site_coords:
-            return np.nan
-
-        lat_site, lon_site = site_coords[site]
-        return haversine_distance_m(lat_s, lon_s, lat_site, lon_site)
-
-    log["Distance_From_Site_m"] = log.apply(compute_distance, axis=1)
+    # Map each site name to an index into float32 lookup arrays, then gather.
+    # The trailing NaN slot is used for sites not in site_coords.
+    site_idx = {name: i for i, name in enumerate(site_coords)}
+    site_lats = np.array([lat for lat, _ in site_coords.values()] + [np.nan], dtype=np.float32)
+    site_lons = np.array([lon for _, lon in site_coords.values()] + [np.nan], dtype=np.float32)
+
+    idx = clean_log["Site_Name"].map(site_idx).to_numpy(dtype=float)
+    idx = np.where(np.isnan(idx), len(site_coords), idx).astype(np.intp)
+    site_lat = site_lats[idx]
+    site_lon = site_lons[idx]
+
+    distance = haversine_distance_m(
+        clean_log["Student_Latitude"].to_numpy(dtype=np.float32),
+        clean_log["Student_Longitude"].to_numpy(dtype=np.float32),
+        site_lat,
+        site_lon,
+    )
 
-    def status_from_distance(d):
-        if pd.isna(d):
-            return "No Location/No Site"
-        if d <= 100:
-            return "Verified"
-        if d <= 300:
-            return "Review"
-        return "Out of Range"
+    # Tier by distance; NaN (no location or unknown site) fails every comparison
+    status = pd.Categorical(
+        np.select(
+            [np.isnan(distance), distance <= 100, distance <= 300],
+            ["No Location/No Site", "Verified", "Review"],
+            default="Out of Range",
+        ),
+        categories=["Verified", "Review", "Out of Range", "No Location/No Site"],
+    )
 
-    log["Verification_Status"] = log["Distance_From_Site_m"].apply(status_from_distance)
+    # Boolean helper columns so summaries can use the built-in "sum" aggregator
+    is_verified = status == "Verified"
+    is_review = status == "Review"
 
-    log["Verified_Hours"] = np.where(
-        log["Verification_Status"] == "Verified",
-        log["Logged_Hours"].fillna(0),
+    # Hours only count when Verified (np.where, not a multiply, so inf/negative
+    # hours on unverified rows give 0.0 rather than NaN/-0.0)
+    verified_hours = np.where(
+        is_verified,
+        clean_log["Logged_Hours"].fillna(0).to_numpy(dtype=float),
         0.0,
     )
 
-    return log
+    # New columns are attached in one assign instead of copying the log first
+    return clean_log.assign(
+        Distance_From_Site_m=distance,
+        Verification_Status=status,
+        _is_verified=is_verified,
+        _is_review=is_review,
+        Verified_Hours=verified_hours,
+    )
 
 
-def build_student_summary(log: pd.DataFrame) -> pd.DataFrame:
-    """Summary: total verified hours by student."""
+def aggregate_by_student(log: pd.DataFrame) -> pd.DataFrame:
+    """
+    All per-student aggregates in a single groupby pass:
+      Total_Verified_Hours, Verified_Visits, Review_Count, Total_Entries, Last_Recorded_Date
+    """
     if log.empty:
         return pd.DataFrame(
-            columns=["Student_ID", "Total_Verified_Hours", "Verified_Visits", "Last_Recorded_Date"]
+            columns=[
+                "Student_ID",
+                "Total_Verified_Hours",
+                "Verified_Visits",
+                "Review_Count",
+                "Total_Entries",
+                "Last_Recorded_Date",
+            ]
         )
 
-    summary = (
-        log.groupby("Student_ID", dropna=False)
+    return (
+        log.groupby("Student_ID", dropna=False, sort=False, observed=True)
            .agg(
                Total_Verified_Hours=("Verified_Hours", "sum"),
-               Verified_Visits=("Verification_Status", lambda x: (x == "Verified").sum()),
+               Verified_Visits=("_is_verified", "sum"),
+               Review_Count=("_is_review", "sum"),
+               Total_Entries=("_is_verified", "size"),
                Last_Recorded_Date=("Recorded_Date", "max"),
            )
            .reset_index()
     )
+
+
+def build_student_summary(student_agg: pd.DataFrame) -> pd.DataFrame:
+    """Summary: total verified hours by student (from aggregate_by_student)."""
+    summary = student_agg[["Student_ID", "Total_Verified_Hours", "Verified_Visits", "Last_Recorded_Date"]]
     return summary.sort_values("Student_ID")
 
 
+def build_review_summary(student_agg: pd.DataFrame) -> pd.DataFrame:
+    """Students with at least one 'Review' entry (from aggregate_by_student)."""
+    review = student_agg[["Student_ID", "Review_Count", "Total_Entries"]]
+    return review[review["Review_Count"] > 0]
+
+
+def top_students_by_hours(student_summary: pd.DataFrame, k: int) -> pd.DataFrame:
+    """Top k students by Total_Verified_Hours, descending, via a partial sort."""
+    vals = student_summary["Total_Verified_Hours"].to_numpy(dtype=float)
+    k = min(k, len(vals))
+    if k == 0:
+        return student_summary.iloc[:0]
+
+    idx = np.argpartition(-vals, k - 1)[:k]
+    idx = idx[np.argsort(-vals[idx], kind="stable")]
+    return student_summary.iloc[idx]
+
+
 def build_site_summary(log: pd.DataFrame) -> pd.DataFrame:
     """
     Extended site summary:
@@ -231,11 +314,11 @@ def build_site_summary(log: pd.DataFrame) -> pd.DataFrame:
         )
 
     base = (
-        log.groupby("Site_Name", dropna=False)
+        log.groupby("Site_Name", dropna=False, sort=False, observed=True)
            .agg(
                Total_Verified_Hours=("Verified_Hours", "sum"),
-               Verified_Visits=("Verification_Status", lambda x: (x == "Verified").sum()),
-               Unique_Students=("Student_ID", pd.Series.nunique),
+               Verified_Visits=("_is_verified", "sum"),
+               Unique_Students=("Student_ID", "nunique"),
            )
            .reset_index()
     )
@@ -250,6 +333,11 @@ def build_site_summary(log: pd.DataFrame) -> pd.DataFrame:
     return base.sort_values("Site_Name")
 
 
+def drop_helper_columns(log: pd.DataFrame) -> pd.DataFrame:
+    """Drop internal helper columns (prefixed with '_') before display/export."""
+    return log.drop(columns=[c for c in log.columns if c.startswith("_")])
+
+
 def make_output_workbook(log: pd.DataFrame,
                          student_summary: pd.DataFrame,
                          site_summary: pd.DataFrame) -> bytes:
@@ -260,13 +348,68 @@ def make_output_workbook(log: pd.DataFrame,
       - Site_Summary
     """
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
-        log.to_excel(writer, index=False, sheet_name="Practicum_Log")
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        drop_helper_columns(log).to_excel(writer, index=False, sheet_name="Practicum_Log")
         student_summary.to_excel(writer, index=False, sheet_name="Student_Summary")
         site_summary.to_excel(writer, index=False, sheet_name="Site_Summary")
     return output.getvalue()
 
 
+def read_qualtrics_file(qualtrics_file) -> pd.DataFrame:
+    """Read the raw Qualtrics export (.xlsx, .xls or .csv) into a dataframe."""
+    if qualtrics_file.name.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(qualtrics_file, sheet_name=0)
+    # pyarrow parses large Qualtrics CSVs multi-threaded, but its chunker cannot
+    # handle quoted values spanning lines (multi-line free-text answers), so fall
+    # back to the default C engine for those files.
+    try:
+        return pd.read_csv(qualtrics_file, engine="pyarrow")
+    except pd.errors.ParserError:
+        qualtrics_file.seek(0)
+        return pd.read_csv(qualtrics_file)
+
+
+# Raw Qualtrics columns shown in the preview (exports can have 100+ columns)
+PREVIEW_COLS = ("RecordedDate", "Q2.1", "Q4", "Q5", "LocationLatitude", "LocationLongitude")
+
+# Most students the top-N chart can show; pre-ranked once and used as the slider max
+TOP_N_MAX = 50
+
+
+# Bounded: reruns only need the current pair of uploads, and each entry holds a workbook
+@st.cache_data(show_spinner=False, max_entries=4, ttl="1h")
+def process_uploads(site_file, qualtrics_file) -> dict:
+    """
+    Run the whole pipeline (read, clean, geofence, summarize, export) for the two
+    uploaded files and return everything the page displays.
+
+    Cached on the uploads themselves: Streamlit hashes an UploadedFile by its full
+    bytes, so widget reruns (e.g. the top-N slider) skip all of this, while a
+    re-uploaded file with any changed cell is processed again.
+    """
+    site_coords = load_site_coordinates(site_file)
+    raw_df = read_qualtrics_file(qualtrics_file)
+
+    clean_log = clean_qualtrics_df(raw_df)
+    verified_log = add_geofence_and_verification(clean_log, site_coords)
+
+    student_agg = aggregate_by_student(verified_log)
+    student_summary = build_student_summary(student_agg)
+    site_summary = build_site_summary(verified_log)
+
+    return {
+        "site_coords": site_coords,
+        "raw_preview": raw_df.loc[:, [c for c in PREVIEW_COLS if c in raw_df.columns]].iloc[:10],
+        "clean_preview": clean_log.head(20),
+        "verified_preview": drop_helper_columns(verified_log.iloc[:50]),
+        "student_summary": student_summary,
+        "top_students": top_students_by_hours(student_summary, TOP_N_MAX),
+        "review_summary": build_review_summary(student_agg),
+        "site_summary": site_summary,
+        "workbook": make_output_workbook(verified_log, student_summary, site_summary),
+    }
+
+
 # ---------- STREAMLIT APP ----------
 
 st.set_page_config(page_title="Practicum Geofence Verifier", layout="wide")
@@ -307,42 +450,30 @@ with col_data:
 
 if site_file is not None and qualtrics_file is not None:
     try:
-        # Load site coordinates (robust)
-        site_coords = load_site_coordinates(site_file)
+        # Read, clean, geofence and summarize (cached on the uploaded files)
+        results = process_uploads(site_file, qualtrics_file)
+        site_coords = results["site_coords"]
+        student_summary = results["student_summary"]
+        site_summary = results["site_summary"]
 
         st.subheader("Loaded Site Coordinates")
         st.write(f"Sites found: {len(site_coords)}")
         st.dataframe(
-            pd.DataFrame(
-                [
-                    {"Site_Name": name, "Latitude": lat, "Longitude": lon}
-                    for name, (lat, lon) in site_coords.items()
-                ]
-            )
+            pd.DataFrame({
+                "Site_Name": list(site_coords),
+                "Latitude": [lat for lat, _ in site_coords.values()],
+                "Longitude": [lon for _, lon in site_coords.values()],
+            })
         )
 
-        # Read Qualtrics data
-        if qualtrics_file.name.lower().endswith((".xlsx", ".xls")):
-            raw_df = pd.read_excel(qualtrics_file, sheet_name=0)
-        else:
-            raw_df = pd.read_csv(qualtrics_file)
-
-        st.subheader("Raw Qualtrics Data (first 10 rows)")
-        st.dataframe(raw_df.head(10))
+        st.subheader("Raw Qualtrics Data (first 10 rows, key columns)")
+        st.dataframe(results["raw_preview"])
 
-        # Clean log
-        clean_log = clean_qualtrics_df(raw_df)
         st.subheader("Cleaned Practicum Log (before geofence)")
-        st.dataframe(clean_log.head(20))
+        st.dataframe(results["clean_preview"])
 
-        # Geofence + verification
-        verified_log = add_geofence_and_verification(clean_log, site_coords)
         st.subheader("Verified Practicum Log (sample rows)")
-        st.dataframe(verified_log.head(50))
-
-        # Summaries
-        student_summary = build_student_summary(verified_log)
-        site_summary = build_site_summary(verified_log)
+        st.dataframe(results["verified_preview"])
 
         st.subheader("Summary: Verified Hours by Student")
         st.dataframe(student_summary)
@@ -352,17 +483,17 @@ if site_file is not None and qualtrics_file is not None:
             st.markdown("**Bar Chart: Total Verified Hours per Student**")
 
             # Optionally limit to top N students for readability
+            top_n_max = min(TOP_N_MAX, len(student_summary))
             top_n = st.slider(
                 "Maximum number of students to display (by verified hours)",
                 min_value=5,
-                max_value=min(50, len(student_summary)),
+                max_value=top_n_max,
                 value=min(20, len(student_summary)),
             )
 
-            # Sort by hours descending and select top_n
+            # Ranked once per upload (cached); slider moves only slice it
             student_chart_df = (
-                student_summary
-                .sort_values("Total_Verified_Hours", ascending=False)
+                results["top_students"]
                 .head(top_n)
                 .set_index("Student_ID")[["Total_Verified_Hours"]]
             )
@@ -375,18 +506,8 @@ if site_file is not None and qualtrics_file is not None:
         # ---------- NEW: STUDENTS WITH 'REVIEW' ITEMS ----------
         st.subheader("Students with Entries Flagged for Review")
 
-        if not verified_log.empty:
-            review_summary = (
-                verified_log
-                .groupby("Student_ID", dropna=False)
-                .agg(
-                    Review_Count=("Verification_Status", lambda x: (x == "Review").sum()),
-                    Total_Entries=("Verification_Status", "size"),
-                )
-                .reset_index()
-            )
-
-            review_summary = review_summary[review_summary["Review_Count"] > 0]
+        if not student_summary.empty:
+            review_summary = results["review_summary"]
 
             if review_summary.empty:
                 st.success("No students currently have entries flagged for Review. 🎉")
@@ -406,11 +527,9 @@ if site_file is not None and qualtrics_file is not None:
             st.info("No verified log data available to compute review flags.")
 
         # Export
-        excel_bytes = make_output_workbook(verified_log, student_summary, site_summary)
-
         st.download_button(
             label="📥 Download Verified Excel (Log + Student + Site summaries)",
-            data=excel_bytes,
+            data=results["workbook"],
             file_name=f"Practicum_Verified_{datetime.now().date()}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )